@@ -3,27 +3,36 @@ Chaos Test Bot.
 Uses deception sparingly and deterministically via engine RNG.
 """
 
-from engine.judge import Move
+from engine.judge import MOVES
+
+# Buckets at which the opponent is considered low on tokens
+_LOW_OR_EMPTY = frozenset(("LOW", "EMPTY"))
 
 class Bot:
     name = "ChaosTestBot"
 
+    def prepare(self, rounds, rng):
+        # Every decision is a pure function of the RNG, so draw the
+        # whole match up front instead of once per round (legal RNG)
+        self.real_moves = rng.choices(MOVES, k=rounds)
+        self.shadow_rolls = rng.floats(rounds)
+        self.shadow_moves = rng.choices(MOVES, k=rounds)
+
     def play(self, state, rng):
-        # Random real move (legal RNG)
-        real_move = rng.choice(list(Move))
+        i = state["round"] - 1
+        real_move = self.real_moves[i]
 
         # Attempt shadow only when the opponent is "LOW" or worse
         use_shadow = (
-            state["opponent_deception_bucket"] in {"LOW", "EMPTY"}
-            and rng.random() < 0.3
+            state["opponent_deception_bucket"] in _LOW_OR_EMPTY
+            and self.shadow_rolls[i] < 0.3
         )
 
         if use_shadow:
-            shadow_move = rng.choice(list(Move))
             return {
                 "real_move": real_move,
                 "shadow": True,
-                "shadow_move": shadow_move,
+                "shadow_move": self.shadow_moves[i],
             }
 
         return {
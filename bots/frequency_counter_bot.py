@@ -3,34 +3,38 @@ Frequency Counter Bot.
 Counters opponent's most frequent visible move.
 """
 
-from collections import Counter
-from engine.judge import Move, WIN_MAP
+from engine.judge import Move, MOVES, NAME_IDX, WIN_MAP
+
+# Moves that beat MOVES[i], in WIN_MAP order
+_COUNTERS = [
+    tuple(m for m, beats in WIN_MAP.items() if target in beats)
+    for target in MOVES
+]
 
 class Bot:
     name = "FrequencyCounterBot"
 
     def __init__(self):
-        self.opponent_history = []
+        self.counts = [0] * len(MOVES)
+        self.best = None  # index of the most frequent move so far
 
     def play(self, state, rng):
         last = state["opponent_last_visible"]
         if last is not None:
-            self.opponent_history.append(last)
+            idx = NAME_IDX[last]
+            self.counts[idx] += 1
+            # Only the bumped bucket can take the lead; ties keep the leader
+            if self.best is None or self.counts[idx] > self.counts[self.best]:
+                self.best = idx
 
-        if not self.opponent_history:
+        if self.best is None:
             return {
                 "real_move": Move.ROCK,
                 "shadow": False,
             }
 
-        counts = Counter(self.opponent_history)
-        most_common, _ = counts.most_common(1)[0]
-
         # Pick a move that beats the most common
-        counters = [
-            m for m, beats in WIN_MAP.items()
-            if most_common in beats
-        ]
+        counters = _COUNTERS[self.best]
 
         if not counters:
             # Fallback to a default move if no counter is found
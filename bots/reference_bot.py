@@ -16,8 +16,16 @@ This bot is STRICTLY RNG-compliant.
 All randomness is sourced exclusively from the injected RNG.
 """
 
-from collections import Counter
-from engine.judge import Move, MOVES
+from engine.judge import Move, MOVES, NAME_IDX
+
+# Moves that beat each move
+_COUNTERS = {
+    Move.ROCK:     (Move.PAPER, Move.SPOCK),
+    Move.PAPER:    (Move.SCISSORS, Move.LIZARD),
+    Move.SCISSORS: (Move.ROCK, Move.SPOCK),
+    Move.LIZARD:   (Move.ROCK, Move.SCISSORS),
+    Move.SPOCK:    (Move.PAPER, Move.LIZARD),
+}
 
 
 class Bot:
@@ -25,43 +33,36 @@ class Bot:
 
     def __init__(self):
         # Persistent bot state is allowed
-        self.opponent_history = []
-        self.move_counts = Counter()
+        self.moves_seen = 0
+        self.move_counts = [0] * len(MOVES)
+        self.most_common = None  # index into MOVES, updated incrementally
 
     def play(self, state: dict, rng):
         """
         Required interface:
             play(state: dict, rng) -> dict
+
+        Reference bot never uses deception, so "shadow" is always False.
         """
 
         last_visible = state.get("opponent_last_visible")
         if last_visible is not None:
-            self.opponent_history.append(last_visible)
-            self.move_counts[last_visible] += 1
+            self.moves_seen += 1
+            idx = NAME_IDX[last_visible]
+            self.move_counts[idx] += 1
+            best = self.most_common
+            if best is None or self.move_counts[idx] > self.move_counts[best]:
+                self.most_common = idx
 
         # Early game: uniform random
-        if len(self.opponent_history) < 10:
-            return {"real_move": rng.choice(MOVES)}
+        if self.moves_seen < 10:
+            return {"real_move": rng.choice(MOVES), "shadow": False, "shadow_move": None}
 
         # Exploit most frequent opponent move
-        most_common, _ = self.move_counts.most_common(1)[0]
-        counters = self._counters_for(most_common)
-
-        return {"real_move": rng.choice(counters)}
+        counters = self._counters_for(MOVES[self.most_common])
 
-    def request_shadow_move(self, state: dict):
-        """
-        Required interface.
-        Reference bot never uses deception.
-        """
-        return False, None
+        return {"real_move": rng.choice(counters), "shadow": False, "shadow_move": None}
 
     @staticmethod
     def _counters_for(move: Move):
-        return {
-            Move.ROCK:     [Move.PAPER, Move.SPOCK],
-            Move.PAPER:    [Move.SCISSORS, Move.LIZARD],
-            Move.SCISSORS: [Move.ROCK, Move.SPOCK],
-            Move.LIZARD:   [Move.ROCK, Move.SCISSORS],
-            Move.SPOCK:    [Move.PAPER, Move.LIZARD],
-        }[move]
+        return _COUNTERS[move]
@@ -10,8 +10,15 @@ SHADOW_REJECT_PROB = 0.10
 
 MATCHES_PER_PAIR = 3           # number of matches per bot pair
 
+# ---- Bot Isolation ----
+ISOLATE_BOTS = False           # True = each bot runs in its own worker process (hard timeouts)
+
+# ---- Parallelism ----
+MATCH_WORKERS = None           # match worker processes; None = one per CPU core
+
 # ---- Determinism ----
 SEED_SALT = "CHAOS_LEAGUE_2026"
+SEED_VERSION = 2               # 1 = SHA-256 seed derivation, 2 = BLAKE2b (current)
 
 # ---- Logging Controls ----
 LOG_RAW_DATA = True
@@ -22,4 +29,4 @@ LEADERBOARD_SNAPSHOT_INTERVAL = 10
 
 
 # ---- Engine Metadata ----
-ENGINE_VERSION = "0.1.2"
+ENGINE_VERSION = "0.1.3"
@@ -30,10 +30,18 @@ class Bot:
             - opponent_last_visible: Move | None
             - round: int
             - score: int
+            (read-only; the engine refreshes it in place every round,
+             so copy anything you want to keep)
 
         rng:
             - Deterministic random number generator
             - Supports .choice(), .randint(), .random(), etc.
+            - Bulk draws: .integers(low, high, size=n), .floats(n)
+
+        Return:
+            - real_move: Move (used for scoring)
+            - shadow: bool (optional, request a deception token)
+            - shadow_move: Move | None (what the opponent sees if the shadow succeeds)
         """
 
         self.round_count += 1
@@ -42,15 +50,19 @@ class Bot:
         move = rng.choice(MOVES)
 
         return {
-            "real_move": move
+            "real_move": move,
+            "shadow": False,
+            "shadow_move": None,
         }
 
-    def request_shadow_move(self, state: dict):
+    def prepare(self, rounds: int, rng):
         """
         Optional interface.
-        Return (use_shadow: bool, shadow_move: Move | None)
+        Called once before round 1 with the match length and the same RNG.
+        Exceptions are ignored; only isolated bots get a time limit here.
 
-        If you don't use deception, always return:
-            (False, None)
+        Useful for drawing many random values in bulk, e.g.:
+            self.moves = rng.choices(MOVES, k=rounds)
+            self.rolls = rng.floats(rounds)
         """
-        return False, None
+        pass
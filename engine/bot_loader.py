@@ -7,23 +7,117 @@ Responsibilities:
 - Enforce RNG usage rules (static inspection)
 """
 
+import os
+import json
+import hashlib
+import functools
 import importlib.util
 import inspect
 import pathlib
 
-from engine.rng import verify_rng_compliance
+from config import ENGINE_VERSION
+from engine.rng import verify_source_compliance, BANNED_PATTERNS_DIGEST
+
+# Hashes of bot files that already passed the RNG check, persisted across
+# runs and shared by every process that loads bots
+COMPLIANCE_CACHE = pathlib.Path(__file__).resolve().parents[1] / ".rng_compliance_cache.json"
+
+_passed = None  # in-memory copy, read on first use
+
+
+# -------------------------------
+# RNG Compliance Cache
+# -------------------------------
+
+def load_compliance_cache() -> set:
+    """
+    Hashes of bot files that already passed the RNG check.
+    Entries are only trusted for the engine version and banned-pattern
+    list that wrote them; if either differs, the whole cache is dropped.
+    """
+    try:
+        with open(COMPLIANCE_CACHE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return set()
+
+    if (cache.get("engine_version") != ENGINE_VERSION
+            or cache.get("banned_patterns") != BANNED_PATTERNS_DIGEST):
+        return set()
+    return set(cache.get("passed", ()))
+
+
+def save_compliance_cache(passed: set):
+    """
+    Adds hashes to the cache file. Pool workers may save concurrently, so
+    the file is merged with what is on disk and replaced atomically.
+    """
+    passed = load_compliance_cache() | passed
+    cache = {
+        "engine_version": ENGINE_VERSION,
+        "banned_patterns": BANNED_PATTERNS_DIGEST,
+        "passed": sorted(passed),
+    }
+
+    tmp = COMPLIANCE_CACHE.with_name(f"{COMPLIANCE_CACHE.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp, COMPLIANCE_CACHE)
+    except OSError:
+        pass  # the cache is an optimization; a read-only tree just rescans
+
+
+def _check_compliance(source: bytes, bot_name: str):
+    """RNG check, skipped for file contents that already passed."""
+    global _passed
+    if _passed is None:
+        _passed = load_compliance_cache()
+
+    digest = hashlib.sha256(source).hexdigest()
+    if digest in _passed:
+        return
+
+    verify_source_compliance(source, bot_name)
+    _passed.add(digest)
+    save_compliance_cache({digest})
+
+
+# -------------------------------
+# Loading
+# -------------------------------
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_bot(path_str: str, mtime_ns: int, size: int):
+    """
+    Reads, RNG-checks and compiles a bot file, memoized on file identity
+    so the parse/compile/scan happens once per process. Only the code
+    object is cached: every load still runs it in a fresh module, so no
+    module or class state survives from one match to the next.
+    Editing the file changes mtime/size, which invalidates the entry;
+    failures raise and are therefore never cached.
+    """
+    path = pathlib.Path(path_str)
+    source = path.read_bytes()
+
+    # --- Static RNG enforcement ---
+    _check_compliance(source, path.stem)
+
+    return compile(source, path_str, "exec")
 
 
 def load_bot(path: pathlib.Path):
+    """Returns a fresh Bot instance from a freshly executed bot module."""
     if not path.exists():
         raise RuntimeError(f"Bot file not found: {path}")
 
+    st = path.stat()
+    code = _compile_bot(str(path), st.st_mtime_ns, st.st_size)
+
     spec = importlib.util.spec_from_file_location(path.stem, path)
     module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-
-    # --- Static RNG enforcement ---
-    verify_rng_compliance(module, path.stem)
+    exec(code, module.__dict__)
 
     # --- Interface enforcement ---
     if not hasattr(module, "Bot"):
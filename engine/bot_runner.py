@@ -1,33 +1,58 @@
 import time
 from engine.judge import MOVES
+from engine.sandbox import BotWorker, TIMEOUT_SECONDS
+from config import COMPETITION
 
 DEFAULT_MOVE = MOVES[0]
-TIMEOUT_SECONDS = 0.05
+
+
+def bind_rng(bot, rng):
+    """Returns the RNG the engine should use for this bot during a match."""
+    if isinstance(bot, BotWorker):
+        return bot.bind_rng(rng)
+    return rng
+
+
+# -------------------------------
+# Guarded calls
+# -------------------------------
+
+def safe_prepare(bot, rounds, rng):
+    """
+    Runs the optional prepare(rounds, rng) hook once before a match.
+    Exceptions are swallowed. Only isolated bots are held to
+    PREPARE_TIMEOUT_SECONDS; in-process prepare() is not timed, even
+    in COMPETITION mode.
+    """
+    if isinstance(bot, BotWorker):
+        bot.prepare(rounds)
+        return
+
+    if not hasattr(bot, "prepare"):
+        return
+    try:
+        bot.prepare(rounds, rng)
+    except Exception:
+        pass
 
 
 def safe_play(bot, state, rng):
-    start = time.perf_counter()
+    if isinstance(bot, BotWorker):
+        result = bot.play(state)
+        if result is None:
+            return {"real_move": DEFAULT_MOVE}
+        return result
+
+    # In-process timing can only reject a slow move after the fact;
+    # it is enforced for official runs and skipped in simulation.
+    start = time.perf_counter() if COMPETITION else 0.0
     try:
         result = bot.play(state, rng)
     except Exception:
         return {"real_move": DEFAULT_MOVE}
 
-    elapsed = time.perf_counter() - start
-    if elapsed > TIMEOUT_SECONDS:
+    if COMPETITION and time.perf_counter() - start > TIMEOUT_SECONDS:
         return {"real_move": DEFAULT_MOVE}
 
     return result
 
-
-def safe_shadow(bot, state):
-    start = time.perf_counter()
-    try:
-        result = bot.request_shadow_move(state)
-    except Exception:
-        return False, None
-
-    elapsed = time.perf_counter() - start
-    if elapsed > TIMEOUT_SECONDS:
-        return False, None
-
-    return result
@@ -18,9 +18,29 @@ class Move(Enum):
     LIZARD = auto()
     SPOCK = auto()
 
+    # Members are singletons and compare by identity, so the C-level
+    # identity hash is valid and avoids Enum's Python-level __hash__
+    # on every dict/set lookup in the round loop.
+    __hash__ = object.__hash__
+
 # List of all moves
 MOVES = list(Move)
 
+# Precomputed lookups; cheaper than Move.name / Move.value descriptors
+NAME = {m: m.name for m in MOVES}
+IDX = {m: i for i, m in enumerate(MOVES)}
+# Index in MOVES by move name, for names coming from round states
+NAME_IDX = {m.name: i for i, m in enumerate(MOVES)}
+
+# Buckets for deception tokens (individual pools): (name, min tokens left)
+BUCKETS = [
+    ("HIGH", 40),
+    ("MEDIUM", 20),
+    ("LOW", 1),
+    ("EMPTY", 0),
+]
+BUCKET_NAMES = tuple(name for name, _ in BUCKETS)
+
 # Outcome matrix
 WIN_MAP = {
     Move.ROCK:     {Move.SCISSORS, Move.LIZARD},
@@ -32,6 +52,19 @@ WIN_MAP = {
 
 
 
+def _outcome(move_a: Move, move_b: Move):
+    if move_a == move_b:
+        return 0, 0
+    if move_b in WIN_MAP[move_a]:
+        return +1, -1
+    return -1, +1
+
+
+# Flattened outcome table, built once from WIN_MAP:
+# _OUTCOME[IDX[a] * len(MOVES) + IDX[b]] -> (delta_a, delta_b)
+_OUTCOME = tuple(_outcome(a, b) for a in MOVES for b in MOVES)
+
+
 def resolve_round(move_a: Move, move_b: Move):
     """
     Resolves a single round of RPSLS.
@@ -40,14 +73,37 @@ def resolve_round(move_a: Move, move_b: Move):
         where each delta ∈ {+1, 0, -1}
     """
 
-    if move_a == move_b:
-        return 0, 0
+    try:
+        return _OUTCOME[IDX[move_a] * len(MOVES) + IDX[move_b]]
+    except KeyError:
+        # This should never happen if moves are validated upstream
+        raise RuntimeError(f"Unresolvable move pair: {move_a} vs {move_b}")
 
-    if move_b in WIN_MAP[move_a]:
-        return +1, -1
 
-    if move_a in WIN_MAP[move_b]:
-        return -1, +1
+def pair_code(move_a: Move, move_b: Move) -> int:
+    """Packs a round's move pair into one byte (an index into _OUTCOME)."""
+    return IDX[move_a] * len(MOVES) + IDX[move_b]
+
+
+def tally_rounds(codes):
+    """
+    Scores a whole match from its per-round pair codes (bytes/bytearray).
+    Returns:
+        (score_a, score_b, counts_a, counts_b)
+        where counts_* are per-move play counts indexed like MOVES
+    """
+    n = len(MOVES)
+    score_a = score_b = 0
+    counts_a = [0] * n
+    counts_b = [0] * n
+
+    # One C-level count per possible pair instead of Python work per round
+    for code, (delta_a, delta_b) in enumerate(_OUTCOME):
+        c = codes.count(code)
+        if c:
+            score_a += delta_a * c
+            score_b += delta_b * c
+            counts_a[code // n] += c
+            counts_b[code % n] += c
 
-    # This should never happen if moves are validated upstream
-    raise RuntimeError(f"Unresolvable move pair: {move_a} vs {move_b}")
+    return score_a, score_b, counts_a, counts_b
@@ -2,20 +2,25 @@
 Logging system for Chaos League.
 """
 
+import io
 import json
 import pathlib
 import hashlib
 from datetime import datetime, timezone
 
 import config
-from engine.judge import Move
+from engine.judge import Move, NAME
 
 _RESULTS_ROOT = None
 _RAW_FILE = None
 _SUMMARY_FILE = None
 _METADATA_PATH = None
+_SNAPSHOT_PATH = None
 _COMPETITION = False
 
+# rounds.jsonl gets one line per round; write it in large chunks
+_RAW_BUFFER_BYTES = 1 << 20
+
 
 # -------------------------------
 # Helpers
@@ -26,6 +31,7 @@ def _config_fingerprint():
         "ROUNDS": config.ROUNDS,
         "DECEPTION_TOKENS": config.DECEPTION_TOKENS,
         "SEED_SALT": config.SEED_SALT,
+        "SEED_VERSION": config.SEED_VERSION,
         "SHADOW_REJECT_PROB": config.SHADOW_REJECT_PROB,
     }
     blob = json.dumps(payload, sort_keys=True).encode()
@@ -40,14 +46,16 @@ def _ensure_dir(path: pathlib.Path):
     path.mkdir(parents=True, exist_ok=True)
 
 
-def _serialize(obj):
+def _default(obj):
+    # Only called for objects json can't encode natively
     if isinstance(obj, Move):
-        return obj.name
-    if isinstance(obj, dict):
-        return {k: _serialize(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_serialize(v) for v in obj]
-    return obj
+        return NAME[obj]
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# One shared encoder: json.dumps(..., default=...) would build a new
+# JSONEncoder on every call, and the round log calls it every round.
+_encode = json.JSONEncoder(default=_default).encode
 
 
 # -------------------------------
@@ -55,7 +63,7 @@ def _serialize(obj):
 # -------------------------------
 
 def init_logging(competition: bool):
-    global _RESULTS_ROOT, _RAW_FILE, _SUMMARY_FILE, _METADATA_PATH, _COMPETITION
+    global _RESULTS_ROOT, _RAW_FILE, _SUMMARY_FILE, _METADATA_PATH, _SNAPSHOT_PATH, _COMPETITION
 
     _COMPETITION = competition
     if not _COMPETITION:
@@ -74,12 +82,15 @@ def init_logging(competition: bool):
     _ensure_dir(meta_dir)
 
     if config.LOG_RAW_DATA:
-        _RAW_FILE = open(raw_dir / "rounds.jsonl", "w", encoding="utf-8")
+        _RAW_FILE = open(
+            raw_dir / "rounds.jsonl", "w", encoding="utf-8", buffering=_RAW_BUFFER_BYTES
+        )
 
     if config.LOG_SUMMARIES:
         _SUMMARY_FILE = open(summary_dir / "matches.jsonl", "w", encoding="utf-8")
 
     _METADATA_PATH = meta_dir / "tournament.json"
+    _SNAPSHOT_PATH = meta_dir / "snapshots.jsonl"
 
     metadata = {
         "timestamp_utc": stamp,
@@ -89,6 +100,7 @@ def init_logging(competition: bool):
             "DECEPTION_TOKENS": config.DECEPTION_TOKENS,
             "SHADOW_REJECT_PROB": config.SHADOW_REJECT_PROB,
             "SEED_SALT": config.SEED_SALT,
+            "SEED_VERSION": config.SEED_VERSION,
         },
         "config_fingerprint": fingerprint,
     }
@@ -97,18 +109,23 @@ def init_logging(competition: bool):
         json.dump(metadata, f, indent=2)
 
 
+def raw_logging_enabled() -> bool:
+    """True when log_round() would actually write something."""
+    return bool(_COMPETITION and _RAW_FILE)
+
+
 def log_round(data: dict):
     if not (_COMPETITION and _RAW_FILE):
         return
 
-    _RAW_FILE.write(json.dumps(_serialize(data)) + "\n")
+    _RAW_FILE.write(_encode(data) + "\n")
 
 
 def log_match_summary(summary: dict):
     if not (_COMPETITION and _SUMMARY_FILE):
         return
 
-    _SUMMARY_FILE.write(json.dumps(_serialize(summary)) + "\n")
+    _SUMMARY_FILE.write(_encode(summary) + "\n")
 
 
 def log_metadata(extra: dict):
@@ -117,12 +134,67 @@ def log_metadata(extra: dict):
 
     with open(_METADATA_PATH, "r+", encoding="utf-8") as f:
         metadata = json.load(f)
-        metadata.update(_serialize(extra))
+        metadata.update(extra)
         f.seek(0)
-        json.dump(metadata, f, indent=2)
+        json.dump(metadata, f, indent=2, default=_default)
         f.truncate()
 
 
+def log_snapshot(snapshot: dict):
+    """
+    Appends one leaderboard snapshot to metadata/snapshots.jsonl.
+    Snapshots carry only what changed since the previous one, so a
+    snapshot never rewrites tournament.json.
+    """
+    if not _COMPETITION:
+        return
+
+    with open(_SNAPSHOT_PATH, "a", encoding="utf-8") as f:
+        f.write(_encode(snapshot) + "\n")
+
+
+def init_worker_logging(competition: bool):
+    """
+    Logging setup for tournament pool workers.
+    Rounds and summaries are buffered in memory and handed back to the
+    parent with drain_worker_logs(); only the parent touches the files.
+    """
+    global _RAW_FILE, _SUMMARY_FILE, _COMPETITION
+
+    _COMPETITION = competition
+    if not _COMPETITION:
+        return
+
+    if config.LOG_RAW_DATA:
+        _RAW_FILE = io.StringIO()
+
+    if config.LOG_SUMMARIES:
+        _SUMMARY_FILE = io.StringIO()
+
+
+def drain_worker_logs():
+    """Returns (raw_rounds, summaries) buffered since the last drain."""
+    drained = []
+    for f in (_RAW_FILE, _SUMMARY_FILE):
+        if f:
+            drained.append(f.getvalue())
+            f.seek(0)
+            f.truncate()
+        else:
+            drained.append("")
+    return tuple(drained)
+
+
+def write_worker_logs(raw_rounds: str, summaries: str):
+    if not _COMPETITION:
+        return
+
+    if _RAW_FILE and raw_rounds:
+        _RAW_FILE.write(raw_rounds)
+    if _SUMMARY_FILE and summaries:
+        _SUMMARY_FILE.write(summaries)
+
+
 def finalize_logging():
     for f in (_RAW_FILE, _SUMMARY_FILE):
         if f:
@@ -6,11 +6,15 @@ from logs, RNG seeds, and submitted bot files.
 """
 
 import json
+import mmap
 import pathlib
-import random
+from types import MappingProxyType
 from engine.bot_loader import load_bot
-from engine.judge import Move, MOVES
-from config import DECEPTION_TOKENS
+from engine.bot_runner import safe_prepare, DEFAULT_MOVE
+from engine.judge import Move, MOVES, NAME
+from engine.rng import make_rng
+from engine.match import deception_bucket
+from config import ROUNDS, DECEPTION_TOKENS, SHADOW_REJECT_PROB
 
 def _move_from_name(name: str) -> Move:
     """Converts a move name string back into a Move enum."""
@@ -19,6 +23,48 @@ def _move_from_name(name: str) -> Move:
     except KeyError:
         raise RuntimeError(f"Invalid move name in log: {name}")
 
+def _replay_play(bot, state, rng):
+    """
+    Calls play() the way safe_play does in-process: a bot that raises
+    plays the default move. Move timing can't be replayed and is skipped.
+    """
+    try:
+        return bot.play(state, rng)
+    except Exception:
+        return {"real_move": DEFAULT_MOVE}
+
+def _iter_rounds(rounds_log_path: pathlib.Path):
+    """
+    Yields round records from a rounds.jsonl log.
+    The log is memory-mapped and each line handed to json as raw bytes,
+    skipping the buffered text reader and its per-line decode.
+    """
+    with open(rounds_log_path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return  # empty logs can't be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _match_rounds(rounds_log_path: pathlib.Path, bot_a_name: str, bot_b_name: str):
+    """
+    Yields the rounds of the first logged match between two bots.
+    A match's rounds are written contiguously, so reading stops as soon
+    as the block ends instead of scanning the rest of the log.
+    """
+    started = False
+    for r in _iter_rounds(rounds_log_path):
+        if r["bot_a"] == bot_a_name and r["bot_b"] == bot_b_name:
+            if started and r["round"] == 1:
+                return  # next match of the same pair
+            started = True
+            yield r
+        elif started:
+            return
+
+
 def validate_match_replay(match_metadata_path: pathlib.Path, bots_dir: pathlib.Path):
     """
     Replays a match from log metadata and validates round outcomes.
@@ -50,25 +96,19 @@ def validate_match_replay(match_metadata_path: pathlib.Path, bots_dir: pathlib.P
     bot_a = load_bot(bot_a_file)
     bot_b = load_bot(bot_b_file)
 
-    # --- Read logged rounds ---
-    with open(rounds_log_path, "r", encoding="utf-8") as f:
-        logged_rounds = [json.loads(line) for line in f]
-
-    # Filter rounds for this bot pair
-    match_rounds = [
-        r for r in logged_rounds
-        if r["bot_a"] == bot_a_name and r["bot_b"] == bot_b_name
-    ]
+    # --- Stream logged rounds for this bot pair ---
+    match_rounds = _match_rounds(rounds_log_path, bot_a_name, bot_b_name)
 
     last_real_a = last_real_b = None
     last_visible_a = last_visible_b = None
     tokens_a = tokens_b = DECEPTION_TOKENS
 
-    # Initialize a deterministic RNG for replay consistency.
-    # Ideally, the seed should come from the metadata if available.
-    seed = metadata.get("seed", 42)
-    rng_a = random.Random(f"{seed}_a")
-    rng_b = random.Random(f"{seed}_b")
+    # Derive the RNGs exactly as the match engine does
+    rng_a, rng_b = make_rng(bot_a_name, bot_b_name)
+
+    # Same guard as the engine: a prepare() that raises is ignored there too
+    safe_prepare(bot_a, ROUNDS, rng_a)
+    safe_prepare(bot_b, ROUNDS, rng_b)
 
     for round_idx, log_entry in enumerate(match_rounds, start=1):
         # --- Convert logged moves to Move enums ---
@@ -78,22 +118,25 @@ def validate_match_replay(match_metadata_path: pathlib.Path, bots_dir: pathlib.P
         logged_visible_b = _move_from_name(log_entry["b_visible"])
 
         # --- Build bot states ---
-        state_a = {
+        # Read-only views, exactly as the engine hands them to bots.
+        # Buckets come from the tokens left at the start of the round;
+        # the logged buckets are taken after it.
+        state_a = MappingProxyType({
             "round": round_idx,
-            "opponent_last_visible": last_visible_b.name if last_visible_b else None,
-            "self_last_real": last_real_a.name if last_real_a else None,
-            "opponent_deception_bucket": log_entry["b_bucket"],
-        }
-        state_b = {
+            "opponent_last_visible": NAME[last_visible_b] if last_visible_b else None,
+            "self_last_real": NAME[last_real_a] if last_real_a else None,
+            "opponent_deception_bucket": deception_bucket(tokens_b),
+        })
+        state_b = MappingProxyType({
             "round": round_idx,
-            "opponent_last_visible": last_visible_a.name if last_visible_a else None,
-            "self_last_real": last_real_b.name if last_real_b else None,
-            "opponent_deception_bucket": log_entry["a_bucket"],
-        }
+            "opponent_last_visible": NAME[last_visible_a] if last_visible_a else None,
+            "self_last_real": NAME[last_real_b] if last_real_b else None,
+            "opponent_deception_bucket": deception_bucket(tokens_a),
+        })
 
         # --- Call bot play with valid RNG ---
-        out_a = bot_a.play(state_a, rng=rng_a)
-        out_b = bot_b.play(state_b, rng=rng_b)
+        out_a = _replay_play(bot_a, state_a, rng_a)
+        out_b = _replay_play(bot_b, state_b, rng_b)
 
         real_a = out_a.get("real_move", None)
         real_b = out_b.get("real_move", None)
@@ -111,13 +154,13 @@ def validate_match_replay(match_metadata_path: pathlib.Path, bots_dir: pathlib.P
                 f"Replay mismatch round {round_idx} for {bot_b_name}: {real_b} != {logged_real_b}"
             )
 
-        # --- Shadow token bookkeeping ---
-        shadow_a = out_a.get("shadow", False)
-        shadow_b = out_b.get("shadow", False)
-        if shadow_a and tokens_a > 0:
-            tokens_a -= 1
-        if shadow_b and tokens_b > 0:
-            tokens_b -= 1
+        # --- Shadow token bookkeeping (mirrors the engine's RNG draw) ---
+        if out_a.get("shadow", False) and tokens_a > 0 and out_a.get("shadow_move") is not None:
+            if rng_a.random() > SHADOW_REJECT_PROB:
+                tokens_a -= 1
+        if out_b.get("shadow", False) and tokens_b > 0 and out_b.get("shadow_move") is not None:
+            if rng_b.random() > SHADOW_REJECT_PROB:
+                tokens_b -= 1
 
         # --- Update history ---
         last_real_a = real_a
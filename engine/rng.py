@@ -7,9 +7,11 @@ This module guarantees:
 - No hidden entropy sources
 """
 
+import re
 import random
 import hashlib
 import inspect
+import pathlib
 
 from config import SEED_SALT
 
@@ -18,17 +20,52 @@ from config import SEED_SALT
 # RNG Creation
 # -------------------------------
 
+# Per-bot seed masks applied to the shared match seed
+SEED_A_MASK = 0xA5A5A5A5
+SEED_B_MASK = 0x5A5A5A5A
+
+# Tail of every seed string ("|" + salt), encoded once
+_SALT_BYTES = f"|{SEED_SALT}".encode()
+
+class MatchRNG(random.Random):
+    """
+    The RNG handed to bots: a random.Random with a few bulk draws, so a
+    bot can take a whole match's worth of numbers in one call
+    (typically from prepare()). Same generator, same seeding.
+    """
+
+    def integers(self, low: int, high: int = None, size: int = None):
+        """Ints in [low, high), or [0, low) if high is omitted; a list if size is given."""
+        if high is None:
+            low, high = 0, low
+        if high <= low:
+            raise ValueError(f"empty range for integers({low}, {high})")
+        if size is None:
+            return self.randrange(low, high)
+        return self.choices(range(low, high), k=size)
+
+    def floats(self, size: int):
+        """A list of size floats in [0.0, 1.0)."""
+        draw = self.random
+        return [draw() for _ in range(size)]
+
+
 def make_rng(name_a: str, name_b: str):
     """
     Creates two deterministic RNG instances for a match.
     One RNG per bot, derived from the same match seed.
     """
 
-    seed_str = f"{name_a}|{name_b}|{SEED_SALT}"
-    seed = int(hashlib.sha256(seed_str.encode()).hexdigest(), 16) % (2**32)
+    # Hashes "name_a|name_b|SEED_SALT" piecewise (same digest);
+    # the 4-byte BLAKE2b digest is exactly the 32-bit seed (SEED_VERSION 2)
+    h = hashlib.blake2b(name_a.encode(), digest_size=4)
+    h.update(b"|")
+    h.update(name_b.encode())
+    h.update(_SALT_BYTES)
+    seed = int.from_bytes(h.digest(), "little")
 
-    rng_a = random.Random(seed ^ 0xA5A5A5A5)
-    rng_b = random.Random(seed ^ 0x5A5A5A5A)
+    rng_a = MatchRNG(seed ^ SEED_A_MASK)
+    rng_b = MatchRNG(seed ^ SEED_B_MASK)
 
     return rng_a, rng_b
 
@@ -37,6 +74,34 @@ def make_rng(name_a: str, name_b: str):
 # RNG Compliance Enforcement
 # -------------------------------
 
+_BANNED_PATTERNS = (
+    "random.",
+    "import random",
+    "from random",
+    "numpy.random",
+    "np.random",
+    "time.time",
+    "os.urandom",
+    "secrets.",
+)
+
+# All patterns in one precompiled alternation inside a lookahead, so a
+# single pass reports every occurrence, overlapping ones included
+# ("random." inside "import random.x"). A position only reports its first
+# matching alternative, which is enough as long as no banned pattern
+# starts another one.
+# Compiled for bytes: bot files are scanned as read, without decoding.
+_BANNED_RE = re.compile(
+    b"(?=(" + b"|".join(re.escape(p.encode()) for p in _BANNED_PATTERNS) + b"))"
+)
+
+# Fingerprint of the banned list; cached compliance results from a
+# different list must not be trusted
+BANNED_PATTERNS_DIGEST = hashlib.sha256(
+    "\n".join(_BANNED_PATTERNS).encode()
+).hexdigest()
+
+
 def verify_rng_compliance(bot_module, bot_name: str):
     """
     Performs a best-effort static inspection to detect
@@ -45,26 +110,28 @@ def verify_rng_compliance(bot_module, bot_name: str):
     This is not a sandbox — it is a deterrent.
     """
 
-    source = inspect.getsource(bot_module)
-
-    banned_patterns = [
-        "random.",
-        "import random",
-        "from random",
-        "numpy.random",
-        "np.random",
-        "time.time",
-        "os.urandom",
-        "secrets.",
-    ]
-
-    violations = [
-        pattern for pattern in banned_patterns
-        if pattern in source
-    ]
-
-    if violations:
-        raise RuntimeError(
-            f"Bot '{bot_name}' violates RNG rules. "
-            f"Illegal randomness detected: {violations}"
-        )
+    path = getattr(bot_module, "__file__", None)
+    if path:
+        source = pathlib.Path(path).read_bytes()
+    else:
+        source = inspect.getsource(bot_module)
+
+    verify_source_compliance(source, bot_name)
+
+
+def verify_source_compliance(source, bot_name: str):
+    """Same check as verify_rng_compliance, on already-read bot source (bytes or str)."""
+
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+
+    hits = {m.group(1).decode() for m in _BANNED_RE.finditer(source)}
+    if not hits:
+        return
+
+    violations = [pattern for pattern in _BANNED_PATTERNS if pattern in hits]
+
+    raise RuntimeError(
+        f"Bot '{bot_name}' violates RNG rules. "
+        f"Illegal randomness detected: {violations}"
+    )
@@ -0,0 +1,238 @@
+"""
+Bot isolation for Chaos League.
+
+Runs a bot in its own long-lived worker process (ISOLATE_BOTS), so a
+move that overruns its time limit can actually be cut off.
+"""
+
+import multiprocessing
+from types import MappingProxyType
+from engine.judge import MOVES, NAME, NAME_IDX, BUCKET_NAMES
+from engine.bot_loader import load_bot
+from engine.rng import MatchRNG
+from config import ISOLATE_BOTS
+
+TIMEOUT_SECONDS = 0.05
+PREPARE_TIMEOUT_SECONDS = 1.0
+STARTUP_TIMEOUT_SECONDS = 5.0
+# Consecutive timed-out moves after which a bot is retired for the match
+MAX_CONSECUTIVE_TIMEOUTS = 3
+
+
+# Round states cross the pipe as 4 small ints instead of a dict of strings
+_MOVE_NAMES = tuple(NAME[m] for m in MOVES)
+_BUCKET_INDEX = {name: i for i, name in enumerate(BUCKET_NAMES)}
+
+
+def _encode_state(state):
+    visible = state["opponent_last_visible"]
+    last_real = state["self_last_real"]
+    return (
+        state["round"],
+        -1 if visible is None else NAME_IDX[visible],
+        -1 if last_real is None else NAME_IDX[last_real],
+        _BUCKET_INDEX[state["opponent_deception_bucket"]],
+    )
+
+
+def _decode_state(wire):
+    # Read-only, like the view in-process bots get from run_match
+    round_idx, visible, last_real, bucket = wire
+    return MappingProxyType({
+        "round": round_idx,
+        "opponent_last_visible": None if visible < 0 else _MOVE_NAMES[visible],
+        "self_last_real": None if last_real < 0 else _MOVE_NAMES[last_real],
+        "opponent_deception_bucket": BUCKET_NAMES[bucket],
+    })
+
+
+def _worker_loop(conn, path):
+    """
+    Child side of a BotWorker.
+    Loads the bot once, then serves (method, payload) requests over the
+    pipe until the parent closes it. The bot's RNG lives here, so its
+    state never has to cross the pipe on a normal move.
+    """
+    try:
+        bot = load_bot(path)
+    except Exception as e:
+        conn.send(("error", str(e)))
+        return
+    conn.send(("ready", None))
+
+    rng = MatchRNG()
+    while True:
+        try:
+            method, payload = conn.recv()
+        except (EOFError, OSError):
+            return
+
+        try:
+            if method == "play":
+                result = bot.play(_decode_state(payload), rng)
+            elif method == "random":
+                result = rng.random()
+            elif method == "prepare":
+                if hasattr(bot, "prepare"):
+                    bot.prepare(payload, rng)
+                result = True  # distinguishes a finished prepare from a failed one
+            elif method == "bind":
+                rng.setstate(payload)
+                result = True
+            else:
+                result = None  # unknown request
+        except Exception:
+            result = None
+
+        try:
+            conn.send(result)
+        except Exception:
+            # Unpicklable bot output counts as a failed move
+            conn.send(None)
+
+
+class BotWorker:
+    """
+    Runs a bot inside a long-lived child process.
+
+    The bot is loaded once per worker and every move is a single pipe
+    round-trip, so the per-move timeout can be enforced for real:
+    a bot that misses TIMEOUT_SECONDS is killed and respawned
+    (losing its internal state) and the move falls back to the default.
+    After MAX_CONSECUTIVE_TIMEOUTS in a row the bot is retired instead,
+    so a bot that hangs on every move doesn't cost a respawn per round.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.proc = None
+        self.conn = None
+        self._rng_state = None
+        self._rounds = None  # set once prepare() has succeeded
+        self._timeouts = 0  # consecutive timed-out calls
+        self._spawn()
+
+    def _spawn(self):
+        self.conn, child_conn = multiprocessing.Pipe(duplex=True)
+        self.proc = multiprocessing.Process(
+            target=_worker_loop, args=(child_conn, self.path), daemon=True
+        )
+        self.proc.start()
+        child_conn.close()
+
+        if not self.conn.poll(STARTUP_TIMEOUT_SECONDS):
+            self.close()
+            raise RuntimeError(f"Bot '{self.path.name}' failed to start in time")
+
+        status, detail = self.conn.recv()
+        if status != "ready":
+            self.close()
+            raise RuntimeError(detail)
+
+    def _respawn(self, prepare=True):
+        """
+        Replaces a hung or dead worker with a fresh Bot().
+        The new bot is put back where the match started: its RNG is reset
+        to the match's initial state and prepare() is run again, so it
+        replays the same pre-match draws. Any state the old bot built up
+        during play is lost.
+
+        A restore request that fails is never left pending in the pipe:
+        a failed prepare gets one more respawn without it, and a failed
+        restart or bind retires the bot for the rest of the match.
+        """
+        self.close()
+        try:
+            self._spawn()
+        except RuntimeError:
+            return  # retired: every later call falls back to the default
+        if self._rng_state is not None:
+            if not self._restore("bind", self._rng_state, STARTUP_TIMEOUT_SECONDS):
+                self.close()
+                return
+        if prepare and self._rounds is not None:
+            if not self._restore("prepare", self._rounds, PREPARE_TIMEOUT_SECONDS):
+                # Don't retry a prepare that keeps failing; keep the bare bot
+                self._respawn(prepare=False)
+
+    def _restore(self, method, payload, timeout):
+        """One request during a respawn; never respawns itself."""
+        try:
+            self.conn.send((method, payload))
+            if not self.conn.poll(timeout):
+                return False
+            return self.conn.recv() is not None
+        except (EOFError, OSError):
+            return False
+
+    def bind_rng(self, rng):
+        """Hands the bot's RNG to the worker; returns a stand-in for the engine."""
+        self._rng_state = rng.getstate()
+        self.call("bind", self._rng_state, timeout=STARTUP_TIMEOUT_SECONDS)
+        return _WorkerRNG(self)
+
+    def prepare(self, rounds):
+        if self.call("prepare", rounds, timeout=PREPARE_TIMEOUT_SECONDS):
+            # Remembered so a respawned bot can be prepared again
+            self._rounds = rounds
+
+    def play(self, state):
+        return self.call("play", _encode_state(state))
+
+    def call(self, method, payload, timeout=TIMEOUT_SECONDS):
+        """Returns the bot's result, or None if it failed or timed out."""
+        if self.conn is None:
+            return None  # retired after a failed respawn
+        try:
+            self.conn.send((method, payload))
+            if not self.conn.poll(timeout):
+                self._timeouts += 1
+                if self._timeouts >= MAX_CONSECUTIVE_TIMEOUTS:
+                    self.close()  # retired: every later call falls back to the default
+                else:
+                    self._respawn()
+                return None
+            result = self.conn.recv()
+            self._timeouts = 0
+            return result
+        except (EOFError, OSError):
+            self._respawn()
+            return None
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        if self.proc is not None:
+            if self.proc.is_alive():
+                self.proc.kill()
+            self.proc.join()
+            self.proc = None
+
+
+class _WorkerRNG:
+    """
+    Engine-side view of an RNG owned by a BotWorker.
+    The engine only draws from a bot's RNG for shadow rejection, which is
+    rare enough to forward to the worker instead of syncing state every move.
+    """
+
+    def __init__(self, worker):
+        self.worker = worker
+
+    def random(self):
+        value = self.worker.call("random", None)
+        # A lost draw rejects the shadow
+        return 0.0 if value is None else value
+
+
+def spawn_bot(path):
+    """Loads a bot in-process, or in its own worker when ISOLATE_BOTS is set."""
+    if ISOLATE_BOTS:
+        return BotWorker(path)
+    return load_bot(path)
+
+
+def release_bot(bot):
+    if isinstance(bot, BotWorker):
+        bot.close()
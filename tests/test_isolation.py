@@ -0,0 +1,139 @@
+"""
+Bot isolation check for Chaos League.
+
+Purpose:
+- Exercises the BotWorker respawn / restore / retire paths
+- A bot that hangs once only loses that one move
+- A bot that kills its own worker doesn't take the match down
+- A bot whose prepare() hangs is respawned once and keeps playing
+"""
+
+import pathlib
+import tempfile
+from engine.judge import Move
+from engine.rng import make_rng
+from engine.match import run_match
+from engine.sandbox import BotWorker
+from engine.bot_runner import bind_rng, safe_prepare, safe_play
+from config import ROUNDS
+
+SLEEPS_ONCE = """
+import time
+from engine.judge import Move
+
+class Bot:
+    def play(self, state, rng):
+        if state["round"] == 3:
+            time.sleep(1)
+        return {"real_move": Move.PAPER}
+"""
+
+EXITS_MID_MATCH = """
+import os
+from engine.judge import Move
+
+class Bot:
+    def play(self, state, rng):
+        if state["round"] == 5:
+            os._exit(1)
+        return {"real_move": Move.PAPER}
+"""
+
+PREPARE_HANGS = """
+import time
+from engine.judge import Move
+
+class Bot:
+    def prepare(self, rounds, rng):
+        time.sleep(5)
+
+    def play(self, state, rng):
+        return {"real_move": Move.PAPER}
+"""
+
+PLAYS_PAPER = """
+from engine.judge import Move
+
+class Bot:
+    def play(self, state, rng):
+        return {"real_move": Move.PAPER}
+"""
+
+
+def _state(round_idx):
+    return {
+        "round": round_idx,
+        "opponent_last_visible": None,
+        "self_last_real": None,
+        "opponent_deception_bucket": "HIGH",
+    }
+
+
+def _write_bot(bots_dir: pathlib.Path, name: str, source: str) -> pathlib.Path:
+    path = bots_dir / f"{name}.py"
+    path.write_text(source, encoding="utf-8")
+    return path
+
+
+def check_single_timeout(bots_dir: pathlib.Path):
+    worker = BotWorker(_write_bot(bots_dir, "sleeps_once", SLEEPS_ONCE))
+    try:
+        rng = bind_rng(worker, make_rng("sleeps_once", "opponent")[0])
+        safe_prepare(worker, ROUNDS, rng)
+        moves = [safe_play(worker, _state(r), rng)["real_move"] for r in range(1, 7)]
+    finally:
+        worker.close()
+
+    expected = [Move.PAPER, Move.PAPER, Move.ROCK, Move.PAPER, Move.PAPER, Move.PAPER]
+    if moves != expected:
+        raise RuntimeError(f"Timed-out round not isolated: {moves}")
+    print("Single timeout: only round 3 fell back to ROCK")
+
+
+def check_worker_exit(bots_dir: pathlib.Path):
+    bot_a = BotWorker(_write_bot(bots_dir, "exits_mid_match", EXITS_MID_MATCH))
+    bot_b = BotWorker(_write_bot(bots_dir, "plays_paper", PLAYS_PAPER))
+    try:
+        summary = run_match(bot_a, bot_b, "exits_mid_match", "plays_paper")
+    finally:
+        bot_a.close()
+        bot_b.close()
+
+    if summary["moves_a"] != {"PAPER": ROUNDS - 1, "ROCK": 1}:
+        raise RuntimeError(f"Unexpected moves after worker exit: {summary['moves_a']}")
+    print("Worker exit: match completed with one default move")
+
+
+def check_prepare_hang(bots_dir: pathlib.Path):
+    worker = BotWorker(_write_bot(bots_dir, "prepare_hangs", PREPARE_HANGS))
+    try:
+        rng = bind_rng(worker, make_rng("prepare_hangs", "opponent")[0])
+        first_pid = worker.proc.pid
+        safe_prepare(worker, ROUNDS, rng)
+        respawned_pid = worker.proc.pid if worker.proc else None
+        moves = [safe_play(worker, _state(r), rng)["real_move"] for r in range(1, 6)]
+        final_pid = worker.proc.pid if worker.proc else None
+    finally:
+        worker.close()
+
+    if respawned_pid in (None, first_pid):
+        raise RuntimeError("Worker was not respawned after prepare() hung")
+    if final_pid != respawned_pid:
+        raise RuntimeError("Worker was respawned more than once")
+    if moves != [Move.PAPER] * 5:
+        raise RuntimeError(f"Bot stopped playing after prepare() hung: {moves}")
+    print("Prepare hang: worker respawned once and the bot kept playing")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        bots_dir = pathlib.Path(tmp)
+        check_single_timeout(bots_dir)
+        check_worker_exit(bots_dir)
+        check_prepare_hang(bots_dir)
+
+    print("\nAll isolation checks passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ Purpose:
 - Works even if only one bot exists
 """
 
+import os
 import pathlib
 import json
 from engine.replay_validator import validate_match_replay
@@ -17,10 +18,19 @@ BOTS_DIR = pathlib.Path(__file__).resolve().parents[1] / "bots"
 
 
 def find_latest_tournament() -> pathlib.Path:
-    tournaments = sorted(RESULTS_DIR.glob("tournament_*"))
-    if not tournaments:
+    if not RESULTS_DIR.is_dir():
         raise RuntimeError("No tournament results found in 'results/'")
-    return tournaments[-1]
+
+    # Most recently written tournament, whatever its directory is called
+    with os.scandir(RESULTS_DIR) as it:
+        latest = max(
+            (e for e in it if e.name.startswith("tournament_") and e.is_dir()),
+            key=lambda e: e.stat().st_mtime_ns,
+            default=None,
+        )
+    if latest is None:
+        raise RuntimeError("No tournament results found in 'results/'")
+    return pathlib.Path(latest.path)
 
 
 def main():
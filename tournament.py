@@ -1,46 +1,187 @@
 """
-Chaos League Tournament Runner (Sequential, Deterministic, Safe)
+Chaos League Tournament Runner (Parallel, Deterministic, Safe)
 
 Features:
 - Multiple matches per bot pair
+- Matches run in parallel worker processes, results merged in order
 - Fully compatible with safe_play multiprocessing timeouts
 - Deterministic RNG seeding per match
 - Shadow-move efficiency tracking
 - Tournament leaderboard
 - Automatic leaderboard snapshots
 """
+import os
 import json
+import bisect
 import pathlib
 import itertools
-from collections import defaultdict
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from engine import logger
-from engine.bot_loader import load_bot
+from engine.sandbox import spawn_bot, release_bot
 from engine.match import run_match
-from engine.rng import make_rng
 from config import (
     COMPETITION,
     MATCHES_PER_PAIR,
+    MATCH_WORKERS,
     SEED_SALT,
     LEADERBOARD_SNAPSHOT_INTERVAL,
 )
 
 BOTS_DIR = pathlib.Path("bots")
 
+# Largest pool chunk when matches ship their raw round logs back
+# (about 2.5 MB of log per 10k-round match, so ~10 MB per chunk)
+RAW_LOG_CHUNKSIZE = 4
+
 
 def load_all_bot_names():
-    bots = [f.stem for f in BOTS_DIR.glob("*.py")]
+    # Sorted so the schedule (and every seed) doesn't depend on directory order
+    with os.scandir(BOTS_DIR) as it:
+        bots = sorted(e.name[:-3] for e in it if e.name.endswith(".py") and e.is_file())
     if not bots:
         raise RuntimeError("No bots found in 'bots/'")
     return bots
 
 
-def print_leaderboard(stats: dict):
-    if not stats:
+def _run_single_match(name_a: str, name_b: str):
+    """
+    Runs one match inside a pool worker.
+    Bots are loaded here from their files, so only names and plain
+    results cross the process boundary. The match summary itself is
+    logged by the worker; the driver only gets back the numbers it
+    aggregates:
+        (score_a, score_b, tokens_used_a, tokens_used_b,
+         shadow_efficiency_a, shadow_efficiency_b)
+
+    Failures come back as (None, error message) rather than raising, so
+    one bad match doesn't end the driver's in-order result stream.
+    """
+    bot_a = bot_b = None
+    try:
+        bot_a = spawn_bot(BOTS_DIR / f"{name_a}.py")
+        bot_b = spawn_bot(BOTS_DIR / f"{name_b}.py")
+        summary = run_match(bot_a, bot_b, name_a, name_b)
+    except Exception as e:
+        # Drop whatever the failed match logged before it broke
+        logger.drain_worker_logs()
+        return None, str(e)
+    finally:
+        release_bot(bot_a)
+        release_bot(bot_b)
+
+    result = (
+        summary["score_a"],
+        summary["score_b"],
+        summary["tokens_used_a"],
+        summary["tokens_used_b"],
+        summary["shadow_efficiency_a"],
+        summary["shadow_efficiency_b"],
+    )
+    return result, logger.drain_worker_logs()
+
+
+def _match_pool(workers: int) -> ProcessPoolExecutor:
+    # Workers are spawned fresh so they never inherit the open log files
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=logger.init_worker_logging,
+        initargs=(COMPETITION,),
+    )
+
+
+def _run_matches(names_a: list, names_b: list, workers: int, chunksize: int):
+    """
+    Yields (result, logs) from _run_single_match for every scheduled match,
+    in schedule order.
+
+    A worker process that dies (os._exit, a segfault, the OOM killer) breaks
+    the whole pool, taking every unfinished match with it. The first
+    unfinished match is then rerun alone in a fresh one-worker pool: if that
+    breaks too it is the culprit and only it is reported as failed. Either
+    way the rest of the schedule continues on a new pool. Matches are
+    deterministic, so rerunning them doesn't change their results.
+    """
+    total = len(names_a)
+    done = 0
+    while done < total:
+        with _match_pool(workers) as executor:
+            results = executor.map(
+                _run_single_match, names_a[done:], names_b[done:], chunksize=chunksize
+            )
+            try:
+                for item in results:
+                    yield item
+                    done += 1
+            except BrokenProcessPool:
+                pass
+
+        if done == total:
+            break
+
+        with _match_pool(1) as executor:
+            future = executor.submit(_run_single_match, names_a[done], names_b[done])
+            try:
+                item = future.result()
+            except BrokenProcessPool as e:
+                item = None, f"match worker died: {e}"
+        yield item
+        done += 1
+
+
+# Leaderboard columns. Stats are kept column-wise: one list per field,
+# indexed by the bot's position in bot_names.
+STAT_FIELDS = (
+    "score",
+    "matches",
+    "wins",
+    "losses",
+    "draws",
+    "shadow_used",
+    "shadow_eff_sum",
+)
+
+
+def new_stats(n_bots: int) -> dict:
+    stats = {field: [0] * n_bots for field in STAT_FIELDS}
+    stats["shadow_eff_sum"] = [0.0] * n_bots
+    return stats
+
+
+def stats_row(stats: dict, i: int) -> dict:
+    return {field: stats[field][i] for field in STAT_FIELDS}
+
+
+def stats_rows(bot_names, stats) -> dict:
+    """Per-bot view of the stats columns, for bots that have played."""
+    matches = stats["matches"]
+    return {
+        name: stats_row(stats, i)
+        for i, name in enumerate(bot_names)
+        if matches[i]
+    }
+
+
+def update_ranking(ranking: list, i: int, old_score, new_score, ranked: bool):
+    """
+    Keeps ranking, a sorted list of (-score, bot index), current after bot i's
+    score changes, by moving only its entry. Ties stay in bot_names order.
+    """
+    if ranked:
+        del ranking[bisect.bisect_left(ranking, (-old_score, i))]
+    bisect.insort(ranking, (-new_score, i))
+
+
+def print_leaderboard(bot_names, stats: dict, ranking: list):
+    if not ranking:
         print("No stats to display")
         return
 
-    leaderboard = sorted(stats.items(), key=lambda x: x[1]["score"], reverse=True)
+    score = stats["score"]
+    matches = stats["matches"]
 
     print(
         f"{'Bot':20} {'Score':>6} {'Matches':>7} "
@@ -48,13 +189,17 @@ def print_leaderboard(stats: dict):
         f"{'Shadow':>6} {'ShadowEff':>10}"
     )
 
-    for bot, d in leaderboard:
-        # Shadow efficiency as percentage of shadow tokens used per match
-        eff = d["shadow_efficiency"] / max(1, d["matches"])
+    wins, losses, draws = stats["wins"], stats["losses"], stats["draws"]
+    shadow_used = stats["shadow_used"]
+    shadow_eff_sum = stats["shadow_eff_sum"]
+
+    for _, i in ranking:
+        # Mean shadow efficiency per match (share of tokens spent)
+        eff = shadow_eff_sum[i] / max(1, matches[i])
         print(
-            f"{bot:20} {d['score']:6} {d['matches']:7} "
-            f"{d['wins']:5} {d['losses']:6} {d['draws']:5} "
-            f"{d['shadow_used']:6} {eff:10.2%}"
+            f"{bot_names[i]:20} {score[i]:6} {matches[i]:7} "
+            f"{wins[i]:5} {losses[i]:6} {draws[i]:5} "
+            f"{shadow_used[i]:6} {eff:10.2%}"
         )
 
 
@@ -63,76 +208,104 @@ def run_tournament():
 
     bot_names = load_all_bot_names()
 
-    stats = defaultdict(lambda: {
-        "score": 0,
-        "matches": 0,
-        "wins": 0,
-        "losses": 0,
-        "draws": 0,
-        "shadow_used": 0,
-        "shadow_efficiency": 0.0,
-    })
+    stats = new_stats(len(bot_names))
+    score, matches_played = stats["score"], stats["matches"]
+    wins, losses, draws = stats["wins"], stats["losses"], stats["draws"]
+    shadow_used, shadow_eff_sum = stats["shadow_used"], stats["shadow_eff_sum"]
+    ranking = []
+    changed = set()  # bots touched since the last snapshot
 
+    # The schedule refers to bots by index into the stats columns;
+    # seed labels for the rng log are built up front with it
     matches = []
-    for a, b in itertools.combinations(bot_names, 2):
+    suffix_a = f"_A_{SEED_SALT}"
+    suffix_b = f"_B_{SEED_SALT}"
+    for (ia, a), (ib, b) in itertools.combinations(enumerate(bot_names), 2):
+        prefix_a = f"{a}_{b}_"
+        prefix_b = f"{b}_{a}_"
         for match_idx in range(1, MATCHES_PER_PAIR + 1):
-            matches.append((a, b, match_idx))
+            idx = str(match_idx)
+            matches.append((
+                ia, ib, match_idx,
+                prefix_a + idx + suffix_a,
+                prefix_b + idx + suffix_b,
+            ))
 
     print(f"Total matches to run: {len(matches)}")
 
     completed = 0
     rng_log = []
+    failed = []
 
-    for name_a, name_b, match_idx in matches:
-        try:
-            bot_a = load_bot(BOTS_DIR / f"{name_a}.py")
-            bot_b = load_bot(BOTS_DIR / f"{name_b}.py")
-
-            seed_a = f"{name_a}_{name_b}_{match_idx}_A_{SEED_SALT}"
-            seed_b = f"{name_b}_{name_a}_{match_idx}_B_{SEED_SALT}"
-            make_rng(seed_a, seed_b)
-
-            summary = run_match(bot_a, bot_b, name_a, name_b)
+    # Every match of a pair shares one replay file; only the last one is kept
+    replays = {}
+    if COMPETITION:
+        results_root = logger._RESULTS_ROOT
+        if results_root is None:
+            raise RuntimeError("Logging not initialized")
+        rounds_log = str(results_root / "raw" / "rounds.jsonl")
+
+    # Results come back in schedule order to keep logs deterministic.
+    # Matches are dispatched in chunks (about four per worker) to cut
+    # per-task IPC round-trips. With raw logging on, every match carries
+    # its whole rounds log back and a chunk is only returned once all of
+    # it has run, so the chunk size is capped to bound each chunk's logs.
+    # Finished chunks can still queue up behind a slow earlier one.
+    workers = MATCH_WORKERS or os.cpu_count() or 1  # cpu_count() may be None
+    chunksize = max(1, len(matches) // (workers * 4))
+    if logger.raw_logging_enabled():
+        chunksize = min(chunksize, RAW_LOG_CHUNKSIZE)
+
+    results = _run_matches(
+        [bot_names[ia] for ia, *_ in matches],
+        [bot_names[ib] for _, ib, *_ in matches],
+        workers,
+        chunksize,
+    )
 
-            # --- Write per-match replay metadata ---
-            if COMPETITION:
-                results_root = logger._RESULTS_ROOT
-                if results_root is None:
-                    raise RuntimeError("Logging not initialized")
-                metadata_path = results_root / "metadata" / f"replay_{name_a}_vs_{name_b}.json"
-                replay_meta = {
-                    "bot_a": name_a,
-                    "bot_b": name_b,
-                    "score_a": summary["score_a"],
-                    "score_b": summary["score_b"],
-                    "tokens_used_a": summary["tokens_used_a"],
-                    "tokens_used_b": summary["tokens_used_b"],
-                    "shadow_efficiency_a": summary.get("shadow_efficiency_a", 0.0),
-                    "shadow_efficiency_b": summary.get("shadow_efficiency_b", 0.0),
-                    "rounds_log": str(results_root / "raw" / "rounds.jsonl")
-                }
-                with open(metadata_path, "w", encoding="utf-8") as f:
-                    json.dump(replay_meta, f, indent=2)
-
-        except Exception as e:
-            print(f"[ERROR] Match {name_a} vs {name_b} failed: {e}")
+    for (ia, ib, match_idx, seed_a, seed_b), (result, logs) in zip(matches, results):
+        name_a, name_b = bot_names[ia], bot_names[ib]
+        if result is None:
+            print(f"[ERROR] Match {name_a} vs {name_b} failed: {logs}")
+            failed.append({
+                "bot_a": name_a,
+                "bot_b": name_b,
+                "match_index": match_idx,
+                "error": logs,
+            })
             continue
 
+        raw_rounds, summaries = logs
+        logger.write_worker_logs(raw_rounds, summaries)
+        score_a, score_b, used_a, used_b, eff_a, eff_b = result
+
+        # --- Per-pair replay metadata (written once, after the run) ---
+        if COMPETITION:
+            replays[(name_a, name_b)] = {
+                "bot_a": name_a,
+                "bot_b": name_b,
+                "score_a": score_a,
+                "score_b": score_b,
+                "tokens_used_a": used_a,
+                "tokens_used_b": used_b,
+                "shadow_efficiency_a": eff_a,
+                "shadow_efficiency_b": eff_b,
+                "rounds_log": rounds_log,
+            }
+
         # --- Update tournament stats ---
-        for bot_key, side in [(summary["bot_a"], "a"), (summary["bot_b"], "b")]:
-            s = stats[bot_key]
-            score = summary[f"score_{side}"]
-            tokens_used = summary.get(f"tokens_used_{side}", 0)
-            shadow_eff = summary.get(f"shadow_efficiency_{side}", 0.0)
-
-            s["score"] += score
-            s["matches"] += 1
-            s["wins"] += score > 0
-            s["losses"] += score < 0
-            s["draws"] += score == 0
-            s["shadow_used"] += tokens_used
-            # Update cumulative shadow efficiency as total shadow tokens per match
-            s["shadow_efficiency"] = (s["shadow_efficiency"] * (s["matches"] - 1) + shadow_eff) / s["matches"]
+        for i, points, used, eff in ((ia, score_a, used_a, eff_a), (ib, score_b, used_b, eff_b)):
+            update_ranking(ranking, i, score[i], score[i] + points, matches_played[i] > 0)
+
+            score[i] += points
+            matches_played[i] += 1
+            wins[i] += points > 0
+            losses[i] += points < 0
+            draws[i] += points == 0
+            shadow_used[i] += used
+            # Summed here, averaged once when the leaderboard is printed
+            shadow_eff_sum[i] += eff
+            changed.add(i)
 
         rng_log.append({
             "bot_a": name_a,
@@ -146,25 +319,35 @@ def run_tournament():
 
         if completed % LEADERBOARD_SNAPSHOT_INTERVAL == 0:
             print(f"\n--- Leaderboard Snapshot after {completed} matches ---")
-            print_leaderboard(stats)
+            print_leaderboard(bot_names, stats, ranking)
 
             if COMPETITION:
-                logger.log_metadata({
+                logger.log_snapshot({
                     "snapshot_after_matches": completed,
-                    "snapshot_stats": dict(stats),
+                    "stats": {bot_names[i]: stats_row(stats, i) for i in sorted(changed)},
                 })
+            changed.clear()
 
     if COMPETITION:
+        for (name_a, name_b), replay_meta in replays.items():
+            metadata_path = results_root / "metadata" / f"replay_{name_a}_vs_{name_b}.json"
+            with open(metadata_path, "w", encoding="utf-8") as f:
+                json.dump(replay_meta, f, indent=2)
+
         logger.log_metadata({
-            "final_tournament_stats": dict(stats),
+            "final_tournament_stats": stats_rows(bot_names, stats),
             "rng_seeds": rng_log,
             "matches_per_pair": MATCHES_PER_PAIR,
+            # Matches missing from the stats above, if any
+            "failed_matches": failed,
         })
 
     logger.finalize_logging()
 
     print("\n--- Tournament Complete ---")
-    print_leaderboard(stats)
+    print_leaderboard(bot_names, stats, ranking)
+    if failed:
+        print(f"\n[WARNING] {len(failed)} of {len(matches)} matches failed and are not counted")
 
 
 if __name__ == "__main__":